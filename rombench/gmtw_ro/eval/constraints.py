@@ -1331,7 +1331,7 @@ def _resolve_entity_id(world: World, entity_ref: str) -> str:
     for entity_id, entity in world.canonical_entities.items():
         if entity.name.lower().strip() == entity_ref_lower:
             return entity_id
-        if entity_ref_lower in [alias.lower() for alias in entity.aliases]:
+        if any(alias.lower() == entity_ref_lower for alias in entity.aliases):
             return entity_id
 
     # Not found, return original
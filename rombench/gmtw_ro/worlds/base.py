@@ -2,6 +2,7 @@
 Base data models for GMTW-Ro task worlds
 """
 
+import sys
 from dataclasses import dataclass, field
 from typing import Literal, Any
 from enum import Enum
@@ -22,7 +23,7 @@ class GoalType(str, Enum):
     OPTIONAL = "optional"      # Nice-to-have goals
 
 
-@dataclass
+@dataclass(slots=True)
 class Constraint:
     """A constraint that must be checked"""
     id: str
@@ -33,7 +34,7 @@ class Constraint:
     params: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class Goal:
     """A goal to achieve in the world"""
     id: str
@@ -43,7 +44,7 @@ class Goal:
     params: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class Entity:
     """An entity in the world (attraction, meeting, fact, etc.)"""
     id: str
@@ -52,7 +53,7 @@ class Entity:
     attributes: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class World:
     """A complete task world specification"""
     world_id: str
@@ -114,7 +115,12 @@ class World:
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "World":
-        """Create World from dictionary"""
+        """
+        Create World from dictionary
+
+        Constraint/goal IDs and check_fn names repeat across every instance of
+        a dataset, so they are interned to share one string per name.
+        """
         return cls(
             world_id=data["world_id"],
             world_type=data["world_type"],
@@ -123,21 +129,21 @@ class World:
             payload=data["payload"],
             constraints=[
                 Constraint(
-                    id=c["id"],
+                    id=sys.intern(c["id"]),
                     type=ConstraintType(c["type"]),
                     description_ro=c["description_ro"],
                     description_en=c.get("description_en", ""),
-                    check_fn=c.get("check_fn", ""),
+                    check_fn=sys.intern(c.get("check_fn", "")),
                     params=c.get("params", {}),
                 )
                 for c in data["constraints"]
             ],
             goals=[
                 Goal(
-                    id=g["id"],
+                    id=sys.intern(g["id"]),
                     type=GoalType(g["type"]),
                     description=g["description"],
-                    check_fn=g["check_fn"],
+                    check_fn=sys.intern(g["check_fn"]),
                     params=g.get("params", {}),
                 )
                 for g in data["goals"]
@@ -416,6 +416,175 @@ CITIES = {
 }
 
 
+_CITY_NAMES = tuple(CITIES)
+
+# Folds Romanian diacritics to ASCII for the stripped-name alias
+_ALIAS_FOLD = str.maketrans("ăâîșț", "aaist")
+
+
+def _attraction_columns(attractions: list[dict[str, Any]]) -> dict[str, tuple]:
+    """Transpose the attraction fields generate() aggregates into parallel tuples"""
+    return {
+        "types": tuple(a["type"] for a in attractions),
+        "duration": tuple(a["duration_hours"] for a in attractions),
+        "cost": tuple(a.get("cost_lei", 0) for a in attractions),
+    }
+
+
+# Column-oriented view of CITIES (city -> field -> tuple), so generate() reads
+# the types, costs and durations of the selected attractions by index instead
+# of doing a dict lookup per attraction.
+# CITIES stays the source of truth; records and columns share the same indices.
+_CITY_COLUMNS = {
+    city: _attraction_columns(city_data["attractions"])
+    for city, city_data in CITIES.items()
+}
+
+
+# Constraints with fixed text and params, built once and shared by every
+# generated world. Treat them as read-only.
+_MUST_MONUMENT = Constraint(
+    id="C_MUST_MONUMENT",
+    type=ConstraintType.INSTRUCTION,
+    description_ro="Trebuie să incluzi cel puțin un monument istoric în întregul plan.",
+    description_en="You must include at least one historic monument in the entire plan.",
+    check_fn="check_must_include_type",
+    params={"type_required": "monument"},
+)
+
+_MUST_MUSEUM = Constraint(
+    id="C_MUST_MUSEUM",
+    type=ConstraintType.INSTRUCTION,
+    description_ro="Trebuie să incluzi cel puțin un muzeu în întregul plan.",
+    description_en="You must include at least one museum in the entire plan.",
+    check_fn="check_must_include_type",
+    params={"type_required": "muzeu"},
+)
+
+_FAMILY_FRIENDLY = Constraint(
+    id="C_FAMILY_FRIENDLY",
+    type=ConstraintType.INSTRUCTION,
+    description_ro="Nu include activități care nu sunt potrivite pentru copii mici.",
+    description_en="Do not include activities that are not suitable for small children.",
+    check_fn="check_all_family_friendly",
+    params={},
+)
+
+_NO_DUPLICATES = Constraint(
+    id="C_NO_DUPLICATES",
+    type=ConstraintType.INSTRUCTION,
+    description_ro="Nu vizita același loc de două ori.",
+    description_en="Do not visit the same place twice.",
+    check_fn="check_no_duplicates",
+    params={},
+)
+
+# max_outdoor is always 1 or 2, so both variants are prebuilt
+_MAX_OUTDOOR_PER_DAY = {
+    1: Constraint(
+        id="C_MAX_OUTDOOR_PER_DAY",
+        type=ConstraintType.INSTRUCTION,
+        description_ro="Maxim 1 activitate în aer liber pe zi.",
+        description_en="At most 1 outdoor activity per day.",
+        check_fn="check_max_outdoor_per_day",
+        params={"max_outdoor": 1},
+    ),
+    2: Constraint(
+        id="C_MAX_OUTDOOR_PER_DAY",
+        type=ConstraintType.INSTRUCTION,
+        description_ro="Maxim 2 activități în aer liber pe zi.",
+        description_en="At most 2 outdoor activities per day.",
+        check_fn="check_max_outdoor_per_day",
+        params={"max_outdoor": 2},
+    ),
+}
+
+# Per-difficulty generation settings, looked up once per world.
+# days: pool for the trip length; max_outdoor: fixed limit, or None to draw
+# 1 or 2 (a fixed limit must not consume a draw); the remaining flags gate
+# optional constraints.
+_DIFFICULTY_CONFIG = {
+    "easy": {
+        "days": (2, 3),
+        "max_outdoor": None,
+        "require_museum": False,
+        "budget": False,
+        "no_duplicates": False,
+        "hard_constraints": False,
+    },
+    "medium": {
+        "days": (3, 4),
+        "max_outdoor": None,
+        "require_museum": True,
+        "budget": True,
+        "no_duplicates": True,
+        "hard_constraints": False,
+    },
+    "hard": {
+        "days": (3, 4),
+        "max_outdoor": 1,
+        "require_museum": True,
+        "budget": True,
+        "no_duplicates": True,
+        "hard_constraints": True,
+    },
+}
+
+# Any other difficulty string: the longer trip, none of the optional
+# constraints (what the per-difficulty checks have always produced)
+_FALLBACK_DIFFICULTY_CONFIG = {
+    "days": (3, 4),
+    "max_outdoor": None,
+    "require_museum": False,
+    "budget": False,
+    "no_duplicates": False,
+    "hard_constraints": False,
+}
+
+
+def build_attraction_entities(
+    selected_attractions: list[dict[str, Any]],
+) -> tuple[dict[str, Entity], list[dict[str, Any]]]:
+    """
+    Build canonical entities and payload records for the selected attractions
+
+    Attractions get sequential IDs (A1, A2, ...) in selection order.
+
+    Returns:
+        (entities keyed by ID, payload attraction list)
+    """
+    entities = {}
+    attractions_list = []
+
+    for idx, attr in enumerate(selected_attractions):
+        attr_id = f"A{idx + 1}"
+        name_en = attr.get("name_en", attr["name"])
+        name_lower = attr["name"].lower()
+        # Build aliases: Romanian name, Romanian stripped, English name, English lower
+        aliases = [
+            name_lower,
+            name_lower.translate(_ALIAS_FOLD),
+            name_en,
+            name_en.lower(),
+        ]
+        entities[attr_id] = Entity(
+            id=attr_id,
+            name=attr["name"],
+            aliases=aliases,
+            attributes=attr,
+        )
+
+        # Payload record: the attraction's fields prefixed by its ID, with
+        # defaults for the optional fields so prompt templates can rely on them
+        record = {"id": attr_id, **attr}
+        record.setdefault("name_en", attr["name"])
+        record.setdefault("type_en", attr["type"])
+        record.setdefault("cost_lei", 0)
+        attractions_list.append(record)
+
+    return entities, attractions_list
+
+
 class TravelWorldGenerator:
     """Generator for Travel World instances"""
 
@@ -438,117 +607,63 @@ class TravelWorldGenerator:
             difficulty: easy|medium|hard
             **kwargs: Additional parameters
         """
+        cfg = _DIFFICULTY_CONFIG.get(difficulty, _FALLBACK_DIFFICULTY_CONFIG)
+
+        # The random.Random stream is part of the dataset contract: published
+        # instances are regenerated from their seeds, so switching RNGs (e.g.
+        # to numpy.random.Generator) or reordering draws changes every world.
         rng = random.Random(seed)
 
         # Select city
-        city = rng.choice(list(CITIES.keys()))
+        city = rng.choice(_CITY_NAMES)
         city_data = CITIES[city]
 
         # Number of days
-        num_days = rng.choice([2, 3]) if difficulty == "easy" else rng.choice([3, 4])
+        num_days = rng.choice(cfg["days"])
 
         # Select attractions (subset)
         all_attractions = city_data["attractions"]
+        columns = _CITY_COLUMNS[city]
         num_attractions = min(len(all_attractions), rng.randint(4, 6))
-        selected_attractions = rng.sample(all_attractions, num_attractions)
+        # Sampling indices draws the same sequence as sampling the records.
+        # Keep rng.sample even when every attraction is selected: it also
+        # fixes the attraction order (and so the A1..An IDs) and advances the
+        # RNG for the draws below, so a fast path would change every world.
+        selected_idx = rng.sample(range(len(all_attractions)), num_attractions)
+        selected_attractions = [all_attractions[i] for i in selected_idx]
+        selected_types = tuple(map(columns["types"].__getitem__, selected_idx))
+        available_types = set(selected_types)
 
         # Create entities
-        entities = {}
-        attractions_list = []
-
-        for idx, attr in enumerate(selected_attractions):
-            attr_id = f"A{idx + 1}"
-            name_en = attr.get("name_en", attr["name"])
-            # Build aliases: Romanian name, Romanian stripped, English name, English lower
-            aliases = [
-                attr["name"].lower(),
-                attr["name"].lower().replace("ă", "a").replace("â", "a").replace("î", "i").replace("ș", "s").replace("ț", "t"),
-                name_en,
-                name_en.lower(),
-            ]
-            entities[attr_id] = Entity(
-                id=attr_id,
-                name=attr["name"],
-                aliases=aliases,
-                attributes=attr,
-            )
-
-            attractions_list.append({
-                "id": attr_id,
-                "name": attr["name"],
-                "name_en": attr.get("name_en", attr["name"]),
-                "type": attr["type"],
-                "type_en": attr.get("type_en", attr["type"]),
-                "indoor": attr["indoor"],
-                "family_friendly": attr["family_friendly"],
-                "duration_hours": attr["duration_hours"],
-                "cost_lei": attr.get("cost_lei", 0),
-            })
+        entities, attractions_list = build_attraction_entities(selected_attractions)
 
         # Calculate total possible cost for budget constraint
-        total_possible_cost = sum(a.get("cost_lei", 0) for a in selected_attractions)
+        total_possible_cost = sum(map(columns["cost"].__getitem__, selected_idx))
 
         # Generate constraints
         constraints = []
 
         # Must include at least one monument
-        has_monument = any(a["type"] == "monument" for a in selected_attractions)
+        has_monument = "monument" in available_types
         if has_monument:
-            constraints.append(
-                Constraint(
-                    id="C_MUST_MONUMENT",
-                    type=ConstraintType.INSTRUCTION,
-                    description_ro="Trebuie să incluzi cel puțin un monument istoric în întregul plan.",
-                    description_en="You must include at least one historic monument in the entire plan.",
-                    check_fn="check_must_include_type",
-                    params={"type_required": "monument"},
-                )
-            )
+            constraints.append(_MUST_MONUMENT)
 
         # Must include at least one museum (medium/hard difficulty)
-        has_museum = any(a["type"] == "muzeu" for a in selected_attractions)
-        if has_museum and difficulty in ("medium", "hard"):
-            constraints.append(
-                Constraint(
-                    id="C_MUST_MUSEUM",
-                    type=ConstraintType.INSTRUCTION,
-                    description_ro="Trebuie să incluzi cel puțin un muzeu în întregul plan.",
-                    description_en="You must include at least one museum in the entire plan.",
-                    check_fn="check_must_include_type",
-                    params={"type_required": "muzeu"},
-                )
-            )
+        has_museum = "muzeu" in available_types
+        if has_museum and cfg["require_museum"]:
+            constraints.append(_MUST_MUSEUM)
 
         # Max outdoor per day
-        max_outdoor = rng.choice([1, 2]) if difficulty != "hard" else 1
-        activity_word = "activitate" if max_outdoor == 1 else "activități"
-        constraints.append(
-            Constraint(
-                id="C_MAX_OUTDOOR_PER_DAY",
-                type=ConstraintType.INSTRUCTION,
-                description_ro=f"Maxim {max_outdoor} {activity_word} în aer liber pe zi.",
-                description_en=f"At most {max_outdoor} outdoor {'activity' if max_outdoor == 1 else 'activities'} per day.",
-                check_fn="check_max_outdoor_per_day",
-                params={"max_outdoor": max_outdoor},
-            )
-        )
+        max_outdoor = cfg["max_outdoor"] or rng.choice((1, 2))
+        constraints.append(_MAX_OUTDOOR_PER_DAY[max_outdoor])
 
         # Family friendly constraint
         family_trip = rng.choice([True, False])
         if family_trip:
-            constraints.append(
-                Constraint(
-                    id="C_FAMILY_FRIENDLY",
-                    type=ConstraintType.INSTRUCTION,
-                    description_ro="Nu include activități care nu sunt potrivite pentru copii mici.",
-                    description_en="Do not include activities that are not suitable for small children.",
-                    check_fn="check_all_family_friendly",
-                    params={},
-                )
-            )
+            constraints.append(_FAMILY_FRIENDLY)
 
         # Budget constraint (medium/hard difficulty)
-        if difficulty in ("medium", "hard") and total_possible_cost > 50:
+        if cfg["budget"] and total_possible_cost > 50:
             # Set budget to 60-80% of total possible cost
             budget = int(total_possible_cost * rng.uniform(0.5, 0.75))
             constraints.append(
@@ -563,25 +678,16 @@ class TravelWorldGenerator:
             )
 
         # No duplicates constraint (optional, ~30% chance on medium/hard)
-        if difficulty in ("medium", "hard") and rng.random() < 0.3:
-            constraints.append(
-                Constraint(
-                    id="C_NO_DUPLICATES",
-                    type=ConstraintType.INSTRUCTION,
-                    description_ro="Nu vizita același loc de două ori.",
-                    description_en="Do not visit the same place twice.",
-                    check_fn="check_no_duplicates",
-                    params={},
-                )
-            )
+        if cfg["no_duplicates"] and rng.random() < 0.3:
+            constraints.append(_NO_DUPLICATES)
 
         # =====================================================================
         # HARD MODE CONSTRAINTS
         # =====================================================================
 
-        if difficulty == "hard":
+        if cfg["hard_constraints"]:
             # Duration limit per day - calculate based on available attractions
-            total_duration = sum(a["duration_hours"] for a in selected_attractions)
+            total_duration = sum(map(columns["duration"].__getitem__, selected_idx))
             avg_duration = total_duration / len(selected_attractions) if selected_attractions else 2.0
             # Allow about 2-3 activities worth of time per day
             max_hours = rng.uniform(avg_duration * 2, avg_duration * 3)
@@ -599,7 +705,6 @@ class TravelWorldGenerator:
             )
 
             # Type diversity - must include at least 3 different types
-            available_types = set(a["type"] for a in selected_attractions)
             if len(available_types) >= 3:
                 constraints.append(
                     Constraint(
@@ -614,15 +719,14 @@ class TravelWorldGenerator:
 
             # Exclude a type (50% chance) - pick a type that has alternatives
             type_counts = {}
-            for a in selected_attractions:
-                t = a["type"]
+            for t in selected_types:
                 type_counts[t] = type_counts.get(t, 0) + 1
 
             # Types that are required by other constraints - cannot exclude these
             required_types = set()
             if has_monument:
                 required_types.add("monument")
-            if has_museum and difficulty in ("medium", "hard"):
+            if has_museum and cfg["require_museum"]:
                 required_types.add("muzeu")
 
             # Only exclude if there are enough other activities and it's not required
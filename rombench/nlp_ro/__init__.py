@@ -26,48 +26,65 @@ Usage:
     g_score = toolkit.compute_g_score(explanation_text)
 """
 
-from .tokenizer import (
-    Token,
-    tokenize,
-    tokenize_words,
-    strip_diacritics,
-    normalize_diacritics,
-    has_romanian_diacritics,
-    count_diacritics,
-)
+import importlib
 
-from .diacritics import (
-    DiacriticAnalysis,
-    analyze_diacritics,
-    quick_diacritic_check,
-)
+# Public names are resolved lazily (PEP 562): each submodule is imported on
+# first access to one of its exports, so importing the package stays cheap
+# and callers only pay for the analyzers they use.
+# name -> (submodule, attribute in that submodule)
+_LAZY_EXPORTS = {
+    # Tokenizer
+    "Token": ("tokenizer", "Token"),
+    "tokenize": ("tokenizer", "tokenize"),
+    "tokenize_words": ("tokenizer", "tokenize_words"),
+    "tokenize_words_iter": ("tokenizer", "tokenize_words_iter"),
+    "tokenize_words_stripped": ("tokenizer", "tokenize_words_stripped"),
+    "strip_diacritics": ("tokenizer", "strip_diacritics"),
+    "normalize_diacritics": ("tokenizer", "normalize_diacritics"),
+    "has_romanian_diacritics": ("tokenizer", "has_romanian_diacritics"),
+    "count_diacritics": ("tokenizer", "count_diacritics"),
+    # Diacritics
+    "DiacriticAnalysis": ("diacritics", "DiacriticAnalysis"),
+    "analyze_diacritics": ("diacritics", "analyze_diacritics"),
+    "quick_diacritic_check": ("diacritics", "quick_diacritic_check"),
+    # Code-switch
+    "CodeSwitchAnalysis": ("codeswitch", "CodeSwitchAnalysis"),
+    "detect_code_switching": ("codeswitch", "detect_code_switching"),
+    "is_likely_english_text": ("codeswitch", "is_likely_english_text"),
+    # Toolkit
+    "TextQualityReport": ("toolkit", "TextQualityReport"),
+    "RomanianNLPToolkit": ("toolkit", "RomanianNLPToolkit"),
+    "analyze_romanian_text": ("toolkit", "analyze_romanian_text"),
+    "compute_generation_quality": ("toolkit", "compute_generation_quality"),
+    # Grammar (optional - requires language-tool-python)
+    "grammar_is_available": ("grammar", "is_available"),
+    "compute_grammar_score": ("grammar", "compute_grammar_score"),
+    "compute_grammar_scores": ("grammar", "compute_grammar_scores"),
+    "GrammarAnalysis": ("grammar", "GrammarAnalysis"),
+}
+
+
+def __getattr__(name: str):
+    try:
+        module_name, attr = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(f".{module_name}", __name__), attr)
+    globals()[name] = value
+    return value
 
-from .codeswitch import (
-    CodeSwitchAnalysis,
-    detect_code_switching,
-    is_likely_english_text,
-)
 
-from .toolkit import (
-    TextQualityReport,
-    RomanianNLPToolkit,
-    analyze_romanian_text,
-    compute_generation_quality,
-)
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
 
-# Optional grammar module (requires language-tool-python)
-# Import conditionally to avoid ImportError if not installed
-from .grammar import (
-    is_available as grammar_is_available,
-    compute_grammar_score,
-    GrammarAnalysis,
-)
 
 __all__ = [
     # Tokenizer
     "Token",
     "tokenize",
     "tokenize_words",
+    "tokenize_words_iter",
+    "tokenize_words_stripped",
     "strip_diacritics",
     "normalize_diacritics",
     "has_romanian_diacritics",
@@ -88,5 +105,6 @@ __all__ = [
     # Grammar (optional - requires language-tool-python)
     "grammar_is_available",
     "compute_grammar_score",
+    "compute_grammar_scores",
     "GrammarAnalysis",
 ]
@@ -0,0 +1,42 @@
+"""
+Result caching for the text analyzers
+
+The analyzers are pure functions of their arguments, and the same text is
+often analyzed again (re-scoring, retries, duplicated model outputs), so their
+results are memoized. A cached result is shared between calls, which is only
+safe if no caller can change it: every call therefore returns a copy whose
+mutable fields (lists, dicts) are copied as well.
+"""
+
+from copy import deepcopy
+from dataclasses import replace
+from functools import lru_cache, wraps
+
+
+def memoize_analysis(*mutable_fields: str, maxsize: int = 1024):
+    """
+    Memoize a function returning an analysis dataclass.
+
+    Args:
+        mutable_fields: Fields of the result to deep-copy on every call
+        maxsize: Number of results to keep (least recently used are dropped)
+
+    Returns:
+        Decorator; the decorated function keeps lru_cache's cache_info() and
+        cache_clear()
+    """
+    def decorate(func):
+        cached = lru_cache(maxsize=maxsize)(func)
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            result = cached(*args, **kwargs)
+            return replace(result, **{
+                name: deepcopy(getattr(result, name)) for name in mutable_fields
+            })
+
+        wrapper.cache_info = cached.cache_info
+        wrapper.cache_clear = cached.cache_clear
+        return wrapper
+
+    return decorate
@@ -13,12 +13,17 @@ For full language identification, lingua-language-detector is available
 but we keep the core metric deterministic and lightweight.
 """
 
+import math
+from collections import Counter
 from dataclasses import dataclass
-from .tokenizer import tokenize_words, strip_diacritics
+from itertools import islice
+from typing import Optional
+from .caching import memoize_analysis
+from .tokenizer import WORD_PATTERN, tokenize_words, tokenize_words_iter
 from .lexicon import ENGLISH_STOPWORDS, ENGLISH_WHITELIST
 
 
-@dataclass
+@dataclass(slots=True)
 class CodeSwitchAnalysis:
     """Results of code-switch detection"""
     score: float                    # 0.0-1.0, where 1.0 = no code-switching
@@ -31,7 +36,7 @@ class CodeSwitchAnalysis:
 
 # Additional high-confidence English words not in ENGLISH_STOPWORDS
 # These are very unlikely to appear in Romanian naturally
-HIGH_CONFIDENCE_ENGLISH: set[str] = {
+HIGH_CONFIDENCE_ENGLISH: frozenset[str] = frozenset({
     # Pronouns/determiners that differ from Romanian
     "i", "me", "myself", "you", "yourself", "he", "him", "himself",
     "she", "her", "herself", "it", "itself", "we", "us", "ourselves",
@@ -84,10 +89,10 @@ HIGH_CONFIDENCE_ENGLISH: set[str] = {
 
     # Additional English-only words (definitely not Romanian)
     # Common verbs with no Romanian cognate
-    "said", "says", "saying", "asked", "asking", "told", "telling",
+    "said", "says", "saying", "asked", "asking",
     "looked", "looking", "walked", "walking", "talked", "talking",
     "started", "starting", "stopped", "stopping", "helped", "helping",
-    "needed", "needing", "wanted", "wanting", "liked", "liking",
+    "needed", "needing", "liked", "liking",
     "loved", "loving", "hated", "hating", "hoped", "hoping",
     "believed", "believing", "understood", "understanding",
     "remembered", "remembering", "forgot", "forgotten", "forgetting",
@@ -95,7 +100,7 @@ HIGH_CONFIDENCE_ENGLISH: set[str] = {
     "bought", "buying", "sold", "selling", "paid", "paying",
     "sent", "sending", "received", "receiving",
     "written", "writing", "read", "reading",  # "read" as past tense
-    "shown", "showing", "given", "giving", "taken", "taking",
+    "shown", "showing", "taken", "taking",
     "brought", "bringing", "kept", "keeping", "let", "letting",
     "heard", "hearing", "meant", "meaning",
     "became", "becoming", "stood", "standing", "sat", "sitting",
@@ -104,26 +109,25 @@ HIGH_CONFIDENCE_ENGLISH: set[str] = {
     "opened", "opening", "closed", "closing",
     "played", "playing", "watched", "watching",
     "stayed", "staying", "waited", "waiting",
-    "happened", "happening", "seemed", "seeming",
-    "changed", "changing", "followed", "following",
+    "happened", "happening",
+    "changed", "changing", "followed",
     "met", "meeting", "led", "leading",
     "lost", "losing", "won", "winning",
     "built", "building", "cut", "cutting",
-    "spoke", "speaking", "written",
+    "spoke", "speaking",
 
     # Common English nouns with no Romanian cognate
     "something", "nothing", "everything", "anything",
     "someone", "anyone", "everyone", "nobody", "somebody", "anybody", "everybody",
     "somewhere", "anywhere", "everywhere", "nowhere",
-    "sometimes", "always",  # already have but ensuring
-    "maybe", "perhaps", "probably", "certainly", "definitely",
+    "certainly", "definitely",
     "please", "thanks", "sorry", "hello", "goodbye", "okay",
     "today", "tomorrow", "yesterday",
     "morning", "afternoon", "evening", "tonight",
-    "week", "month",  # already have some
+    "month",
     "people", "person", "friend", "friends",
     "job", "jobs", "house", "houses", "car", "cars",
-    "school", "teacher", "teachers", "student", "students",
+    "school", "teacher", "teachers",
     "money", "price", "cost", "costs",
     "food", "drink", "drinks", "meal", "meals",
     "story", "stories", "news", "game", "games",
@@ -144,7 +148,7 @@ HIGH_CONFIDENCE_ENGLISH: set[str] = {
     "step", "steps", "move", "moves",
     "change", "changes", "difference", "differences",
     "answer", "answers", "reason", "reasons",
-    "sense", "senses", "feeling", "feelings",
+    "sense", "senses", "feelings",
     "mind", "minds", "heart", "hearts", "body", "bodies",
     "eye", "eyes", "face", "faces", "head", "heads",
     "hair", "foot", "feet", "arm", "arms", "leg", "legs",
@@ -155,17 +159,17 @@ HIGH_CONFIDENCE_ENGLISH: set[str] = {
     "horse", "horses", "cow", "cows", "sheep",
 
     # English adjectives with no Romanian cognate
-    "happy", "sad", "angry", "afraid", "sorry", "glad", "proud",
+    "happy", "sad", "angry", "afraid", "glad", "proud",
     "tired", "sick", "hungry", "thirsty", "busy", "ready", "quick", "slow",
     "hard", "soft", "hot", "cold", "warm", "cool", "wet", "dry",
-    "clean", "dirty", "empty", "full",
+    "clean", "dirty", "empty",
     "dark", "bright", "deep", "wide", "narrow", "thick", "thin",
     "cheap", "expensive", "rich", "poor",
-    "strong", "weak", "heavy", "light",
+    "strong", "weak", "heavy",
     "beautiful", "ugly", "pretty", "handsome",
     "smart", "stupid", "clever", "wise", "crazy", "strange", "weird",
-    "nice", "kind", "mean", "funny", "serious",
-    "easy", "difficult", "simple", "hard",
+    "nice", "mean", "funny", "serious",
+    "easy", "difficult", "simple",
     "safe", "dangerous", "healthy", "ill",
     "alive", "dead", "awake", "asleep",
     "alone", "together", "single", "double",
@@ -176,13 +180,13 @@ HIGH_CONFIDENCE_ENGLISH: set[str] = {
 
     # English adverbs
     "quickly", "slowly", "easily", "hardly", "nearly", "mostly", "mainly",
-    "simply", "clearly", "obviously", "certainly", "probably", "possibly",
+    "simply", "clearly", "obviously", "possibly",
     "suddenly", "immediately", "finally", "eventually", "recently", "lately",
-    "usually", "often", "sometimes", "rarely", "seldom",
-    "anyway", "somehow", "somewhat", "otherwise", "anywhere", "everywhere",
+    "usually", "sometimes", "rarely", "seldom",
+    "anyway", "somehow", "somewhat", "otherwise",
     "indeed", "instead", "besides", "meanwhile", "therefore", "thus",
     "forward", "backward", "upward", "downward", "inward", "outward",
-    "tonight", "nowadays", "forever", "ago",
+    "nowadays", "forever", "ago",
 
     # ==========================================================================
     # LLM-specific: Words models commonly use in generated text
@@ -232,7 +236,7 @@ HIGH_CONFIDENCE_ENGLISH: set[str] = {
     "match", "matches", "matched", "matching",
 
     # Priority-related (now that prompts use Romanian)
-    "high", "medium", "low", "priority", "priorities",
+    "medium", "low", "priority", "priorities",
 
     # Additional common words that slip through
     # Short common words
@@ -250,7 +254,7 @@ HIGH_CONFIDENCE_ENGLISH: set[str] = {
     "indicate", "indicates", "indicated", "indicating",
     "offer", "offers", "offered", "offering",
     "create", "creates", "created", "creating",
-    "begin", "begins", "began", "begun", "beginning",
+    "begin", "begins", "began", "begun",
     "complete", "completes", "completed", "completing",
     "finish", "finishes", "finished", "finishing",
     "achieve", "achieves", "achieved", "achieving",
@@ -287,8 +291,8 @@ HIGH_CONFIDENCE_ENGLISH: set[str] = {
     # Planning/organization verbs
     "organize", "organizes", "organized", "organizing",  # RO: a organiza
     "maintain", "maintains", "maintained", "maintaining",
-    "follow", "follows", "followed",  # RO: a urma
-    "keep", "keeps", "kept", "keeping",  # RO: a păstra
+    "follow", "follows",  # RO: a urma
+    "keep", "keeps",  # RO: a păstra
     "add", "adds", "added", "adding",  # RO: a adăuga
     "remove", "removes", "removed", "removing",  # RO: a elimina
     "assign", "assigns", "assigned", "assigning",
@@ -299,10 +303,10 @@ HIGH_CONFIDENCE_ENGLISH: set[str] = {
     "maximum",   # RO: maxim
     "minimum",   # RO: minim
     "worst",     # RO: cel mai rău
-}
+})
 
 # Romanian words that look like English (false positives to avoid)
-ROMANIAN_LOOKALIKES: set[str] = {
+ROMANIAN_LOOKALIKES: frozenset[str] = frozenset({
     # Romanian words that happen to match English words
     "nu",       # "no" in Romanian (not English "nu")
     "de",       # preposition
@@ -376,7 +380,6 @@ ROMANIAN_LOOKALIKES: set[str] = {
     "atunci",   # "then"
     "aici",     # "here"
     "acolo",    # "there"
-    "fost",     # "was/been"
     "zile",     # "days"
     "timp",     # "time"
     "ani",      # "years"
@@ -491,7 +494,6 @@ ROMANIAN_LOOKALIKES: set[str] = {
 
     # Time-related
     "an",           # RO: an (year) - NOT English "an" article!
-    "moment",       # RO: moment
 
     # Other common words
     "roman",        # RO: roman (novel) or român (Romanian)
@@ -524,9 +526,22 @@ ROMANIAN_LOOKALIKES: set[str] = {
     "robust",       # RO: robust
     "just",         # RO: just
     "bust",         # RO: bust
-}
+})
+
+
+# Words counted as English: the English lists minus Romanian lookalikes and
+# accepted loanwords, resolved once so each token needs a single lookup.
+# Diacritic-stripped forms need no entries: every English entry is ASCII, so
+# a word with diacritics can never be English, and stripping it only decided
+# whether to skip a word that would not have been counted anyway.
+_ENGLISH_ONLY: frozenset[str] = (
+    (HIGH_CONFIDENCE_ENGLISH | ENGLISH_STOPWORDS)
+    - ROMANIAN_LOOKALIKES
+    - ENGLISH_WHITELIST
+)
 
 
+@memoize_analysis("flagged_words", "details")
 def detect_code_switching(text: str) -> CodeSwitchAnalysis:
     """
     Detect English code-switching in Romanian text.
@@ -543,9 +558,13 @@ def detect_code_switching(text: str) -> CodeSwitchAnalysis:
     Returns:
         CodeSwitchAnalysis with score and details
     """
-    words = tokenize_words(text)
+    # Classify each distinct word once and weight it by its frequency
+    # (tokens are lowercased, so counts are case-folded). Lowercase copies are
+    # streamed into the Counter instead of being kept in a token list.
+    counts = Counter(tokenize_words_iter(text))
+    total = counts.total()
 
-    if not words:
+    if not total:
         return CodeSwitchAnalysis(
             score=1.0,
             total_words=0,
@@ -555,35 +574,21 @@ def detect_code_switching(text: str) -> CodeSwitchAnalysis:
             details={"note": "No words to analyze"}
         )
 
-    english_count = 0
-    flagged = []
-
-    for word in words:
-        word_lower = word.lower()
-        # Also check stripped version (in case diacritics added)
-        word_stripped = strip_diacritics(word_lower)
-
-        # Skip Romanian lookalikes
-        if word_lower in ROMANIAN_LOOKALIKES or word_stripped in ROMANIAN_LOOKALIKES:
-            continue
-
-        # Skip whitelisted loanwords
-        if word_lower in ENGLISH_WHITELIST or word_stripped in ENGLISH_WHITELIST:
-            continue
+    english_found = counts.keys() & _ENGLISH_ONLY
+    english_count = sum(counts[w] for w in english_found)
 
-        # Check if it's a high-confidence English word
-        if word_lower in HIGH_CONFIDENCE_ENGLISH or word_lower in ENGLISH_STOPWORDS:
-            english_count += 1
-            if len(flagged) < 10:  # Keep sample
-                flagged.append(word)
+    # Keep sample: the first English tokens in text order, repeats included.
+    # finditer() rescans lazily, so this stops as soon as the sample is full.
+    flagged = []
+    if english_found:
+        lowered = (m.group().lower() for m in WORD_PATTERN.finditer(text))
+        flagged = list(islice((w for w in lowered if w in english_found), 10))
 
-    total = len(words)
     english_rate = english_count / total if total > 0 else 0.0
 
     # Score: penalize code-switching exponentially
     # Small amounts (< 1%) are tolerable, but more is bad
     # score = exp(-k * rate) where k controls sensitivity
-    import math
     score = math.exp(-20 * english_rate)  # At 5% English, score ~ 0.37
 
     return CodeSwitchAnalysis(
@@ -593,13 +598,17 @@ def detect_code_switching(text: str) -> CodeSwitchAnalysis:
         english_rate=english_rate,
         flagged_words=flagged,
         details={
-            "unique_words": len(set(words)),
+            "unique_words": len(counts),
             "threshold_used": 0.05,  # 5% would be severe
         }
     )
 
 
-def is_likely_english_text(text: str, threshold: float = 0.15) -> bool:
+def is_likely_english_text(
+    text: str,
+    threshold: float = 0.15,
+    analysis: Optional[CodeSwitchAnalysis] = None,
+) -> bool:
     """
     Quick check if text is predominantly English.
 
@@ -608,9 +617,24 @@ def is_likely_english_text(text: str, threshold: float = 0.15) -> bool:
     Args:
         text: Text to check
         threshold: English word rate threshold (default 15%)
+        analysis: Result of detect_code_switching(text), if the caller
+            already has it; avoids analyzing the text again
 
     Returns:
         True if text appears to be English
     """
-    analysis = detect_code_switching(text)
-    return analysis.english_rate > threshold
+    if analysis is not None:
+        return analysis.english_rate > threshold
+
+    # No full analysis needed for a yes/no answer: the rate's denominator is
+    # fixed by the token count and the numerator only grows, so stop at the
+    # first English word that pushes the rate over the threshold.
+    words = tokenize_words(text)
+    total = len(words)
+    english_count = 0
+    for word in words:
+        if word in _ENGLISH_ONLY:
+            english_count += 1
+            if english_count / total > threshold:
+                return True
+    return False
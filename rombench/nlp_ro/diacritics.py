@@ -13,8 +13,10 @@ change meaning. "și" (and) vs "si" (if read as English, meaningless in RO),
 "fără" (without) vs "fara" (not a word).
 """
 
+from collections import Counter
 from dataclasses import dataclass
-from .tokenizer import tokenize_words, strip_diacritics, normalize_diacritics, has_romanian_diacritics
+from .caching import memoize_analysis
+from .tokenizer import tokenize_words_stripped, normalize_diacritics, has_romanian_diacritics
 from .lexicon import MUST_HAVE_DIACRITICS, DIACRITIC_WORDS
 
 
@@ -30,6 +32,27 @@ class DiacriticAnalysis:
     details: dict                   # Additional details
 
 
+# Stripped forms listed in either lexicon; anything else cannot be checked
+_CHECKABLE_STRIPPED = frozenset(MUST_HAVE_DIACRITICS) | frozenset(DIACRITIC_WORDS)
+
+# Example correction for a word written with the wrong diacritics: a listed
+# form other than the bare ASCII one, picked once instead of per error
+_DIACRITIC_EXAMPLE = {
+    stripped: next(iter(forms - {stripped}), next(iter(forms)))
+    for stripped, forms in DIACRITIC_WORDS.items()
+}
+
+# Common words that often appear without their diacritics, checked by
+# quick_diacritic_check
+_CRITICAL_WORDS = frozenset(("si", "in", "sa", "ca", "la"))
+
+# Expected form for each critical word that must carry diacritics
+_CRITICAL_EXPECTED = {
+    w: MUST_HAVE_DIACRITICS[w] for w in _CRITICAL_WORDS if w in MUST_HAVE_DIACRITICS
+}
+
+
+@memoize_analysis("missing_words", "details")
 def analyze_diacritics(text: str) -> DiacriticAnalysis:
     """
     Analyze diacritic usage in Romanian text.
@@ -53,8 +76,8 @@ def analyze_diacritics(text: str) -> DiacriticAnalysis:
     # Check if text has any diacritics at all
     has_diacritics = has_romanian_diacritics(normalized_text)
 
-    # Get word tokens
-    words = tokenize_words(normalized_text)
+    # Get word tokens and their stripped (ASCII) forms
+    words, stripped_words = tokenize_words_stripped(normalized_text)
 
     if not words:
         return DiacriticAnalysis(
@@ -74,59 +97,64 @@ def analyze_diacritics(text: str) -> DiacriticAnalysis:
     # Track which words we've seen (avoid double-counting)
     seen_stripped = set()
 
-    for word in words:
-        # Get stripped (ASCII) form
-        stripped = strip_diacritics(word)
+    # The verdict depends only on the word, so classify each distinct word once
+    # and weight it by its frequency. Counter keeps first-occurrence order, and
+    # a word's first occurrence is where the text-order scan would first have
+    # met it, so missing_examples come out in the same order.
+    word_counts = Counter(zip(words, stripped_words))
+    for (word, stripped), n in word_counts.items():
+        # Most words are in neither lexicon: one probe rules them out
+        if stripped not in _CHECKABLE_STRIPPED:
+            continue
 
-        # Check if this word MUST have diacritics
-        if stripped in MUST_HAVE_DIACRITICS:
-            expected = MUST_HAVE_DIACRITICS[stripped]
+        # One probe per lexicon; None means the stripped form is not listed
+        expected = MUST_HAVE_DIACRITICS.get(stripped)
+        valid_forms = DIACRITIC_WORDS.get(stripped)
 
+        # Check if this word MUST have diacritics
+        if expected is not None:
             if word == expected:
                 # Correct diacritic usage
-                correct_count += 1
+                correct_count += n
             elif word == stripped:
                 # Word appears without diacritics but should have them
-                missing_count += 1
+                missing_count += n
                 if stripped not in seen_stripped and len(missing_examples) < 10:
                     missing_examples.append(f"{word} → {expected}")
                     seen_stripped.add(stripped)
             else:
                 # Word has some diacritics but maybe not all correct
                 # Check if it matches any valid form in DIACRITIC_WORDS
-                if stripped in DIACRITIC_WORDS:
-                    valid_forms = DIACRITIC_WORDS[stripped]
+                if valid_forms is not None:
                     if word in valid_forms:
-                        correct_count += 1
+                        correct_count += n
                     else:
                         # Has diacritics but wrong ones
-                        missing_count += 1
+                        missing_count += n
                         if stripped not in seen_stripped and len(missing_examples) < 10:
                             missing_examples.append(f"{word} → {expected}")
                             seen_stripped.add(stripped)
                 else:
                     # Assume correct if has some diacritics
-                    correct_count += 1
+                    correct_count += n
 
         # Also check broader DIACRITIC_WORDS lexicon
-        elif stripped in DIACRITIC_WORDS:
-            valid_forms = DIACRITIC_WORDS[stripped]
+        elif valid_forms is not None:
             if word in valid_forms:
-                correct_count += 1
-            elif word == stripped and valid_forms != {stripped}:
-                # Word is in ASCII but should have diacritics
-                # (unless the ASCII form itself is valid)
-                missing_count += 1
+                correct_count += n
+            elif word == stripped:
+                # Word is in ASCII but should have diacritics (the ASCII form
+                # is not among the valid forms, or the branch above matched)
+                missing_count += n
                 if stripped not in seen_stripped and len(missing_examples) < 10:
                     example_form = next(iter(valid_forms))
                     missing_examples.append(f"{word} → {example_form}")
                     seen_stripped.add(stripped)
             elif word != stripped:
                 # Word has diacritics but WRONG ones (e.g., "căsă" instead of "casă")
-                missing_count += 1
+                missing_count += n
                 if stripped not in seen_stripped and len(missing_examples) < 10:
-                    example_form = next(iter(valid_forms - {stripped}), next(iter(valid_forms)))
-                    missing_examples.append(f"{word} → {example_form}")
+                    missing_examples.append(f"{word} → {_DIACRITIC_EXAMPLE[stripped]}")
                     seen_stripped.add(stripped)
 
     total_checkable = correct_count + missing_count
@@ -151,7 +179,8 @@ def analyze_diacritics(text: str) -> DiacriticAnalysis:
         missing_words=missing_examples,
         details={
             "total_words": len(words),
-            "unique_words": len(set(words)),
+            # stripped is a function of word, so pairs are as distinct as words
+            "unique_words": len(word_counts),
             "coverage": total_checkable / len(words) if words else 0,
         }
     )
@@ -170,24 +199,21 @@ def quick_diacritic_check(text: str) -> float:
     Returns:
         Score from 0.0 to 1.0
     """
-    words = tokenize_words(text)
+    words, stripped_words = tokenize_words_stripped(text)
     if not words:
         return 1.0
 
     # Check presence of common must-have-diacritics words
-    critical_words = {"si", "in", "sa", "ca", "la"}  # Often appear without diacritics
     found_critical_stripped = 0
     found_critical_correct = 0
 
-    for word in words:
-        stripped = strip_diacritics(word)
-        if stripped in critical_words:
-            if stripped in MUST_HAVE_DIACRITICS:
-                expected = MUST_HAVE_DIACRITICS[stripped]
-                if word == expected:
-                    found_critical_correct += 1
-                elif word == stripped:
-                    found_critical_stripped += 1
+    for word, stripped in zip(words, stripped_words):
+        expected = _CRITICAL_EXPECTED.get(stripped)
+        if expected is not None:
+            if word == expected:
+                found_critical_correct += 1
+            elif word == stripped:
+                found_critical_stripped += 1
 
     total = found_critical_correct + found_critical_stripped
     if total == 0:
@@ -7,11 +7,24 @@ will return None or raise ImportError.
 
 Install with: pip install language-tool-python
 Or: pip install rombench[grammar]
+
+By default language-tool-python starts its own local LanguageTool server.
+To reuse a long-running one instead (warm JVM, no start-up per process),
+point LANGUAGETOOL_URL at it:
+
+    java -cp languagetool-server.jar org.languagetool.server.HTTPServer --port 8010
+    export LANGUAGETOOL_URL=http://localhost:8010
 """
 
+import math
+import os
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Optional
 
+from .caching import memoize_analysis
+
 # Lazy import - don't fail if language_tool_python not installed
 _language_tool = None
 _tool_instance = None
@@ -27,7 +40,11 @@ def _get_tool():
     try:
         import language_tool_python
         _language_tool = language_tool_python
-        _tool_instance = language_tool_python.LanguageTool("ro")
+        remote_server = os.environ.get("LANGUAGETOOL_URL")
+        if remote_server:
+            _tool_instance = language_tool_python.LanguageTool("ro", remote_server=remote_server)
+        else:
+            _tool_instance = language_tool_python.LanguageTool("ro")
         return _tool_instance
     except ImportError:
         raise ImportError(
@@ -69,37 +86,45 @@ class GrammarAnalysis:
     available: bool = True          # Whether LanguageTool was available
 
 
-def is_proper_noun_error(match, text: str) -> bool:
+def is_proper_noun_error(match, text: str, base: int = 0) -> bool:
     """
     Check if the error is likely a false positive on a proper noun.
 
     Proper nouns (names, places) often get flagged as misspellings
     because they're not in the dictionary.
+
+    base is the offset of text within the string LanguageTool checked
+    (non-zero when text was checked as part of a batch).
     """
     # Only filter MORFOLOGIK (spelling) errors
     if "MORFOLOGIK" not in match.rule_id:
         return False
 
-    # Get the problematic word from context
-    offset = match.offset
-    length = match.errorLength
+    # Check if the flagged word starts with uppercase (likely proper noun);
+    # only its first character matters, so index it instead of slicing
+    offset = match.offset - base
+    length = match.error_length
 
-    if offset < len(text) and length > 0:
-        word = text[offset:offset + length]
-        # Check if word starts with uppercase (likely proper noun)
-        if word and word[0].isupper():
-            return True
+    if 0 <= offset < len(text) and length > 0 and text[offset].isupper():
+        return True
 
     return False
 
 
-def analyze_grammar(text: str, filter_proper_nouns: bool = True) -> GrammarAnalysis:
+@memoize_analysis("errors")
+def analyze_grammar(
+    text: str,
+    filter_proper_nouns: bool = True,
+    max_errors: Optional[int] = None,
+) -> GrammarAnalysis:
     """
     Analyze grammar and spelling in Romanian text using LanguageTool.
 
     Args:
         text: Romanian text to analyze
         filter_proper_nouns: If True, skip errors on capitalized words (likely names)
+        max_errors: Keep details for at most this many errors (None = all);
+            counts and score always cover every error
 
     Returns:
         GrammarAnalysis with score and error details
@@ -109,23 +134,151 @@ def analyze_grammar(text: str, filter_proper_nouns: bool = True) -> GrammarAnaly
     """
     tool = _get_tool()
 
-    words = text.split()
-    word_count = len(words)
-
+    word_count = len(text.split())
     if word_count == 0:
-        return GrammarAnalysis(
-            score=1.0,
-            total_words=0,
-            error_count=0,
-            raw_error_count=0,
-            weighted_errors=0,
-            error_density=0,
-            skipped_proper_nouns=0,
-            errors=[],
+        return _empty_analysis()
+
+    return _analysis_from_matches(
+        text, word_count, tool.check(text), filter_proper_nouns, max_errors
+    )
+
+
+# Separator between texts checked together; it starts a new paragraph, so
+# sentence-level rules do not see across texts
+_BATCH_SEPARATOR = "\n\n"
+
+
+def analyze_grammar_batch(
+    texts: list[str],
+    filter_proper_nouns: bool = True,
+    max_batch_chars: int = 20000,
+    max_errors: Optional[int] = None,
+) -> list[GrammarAnalysis]:
+    """
+    Analyze many texts with as few LanguageTool requests as possible.
+
+    Texts are joined into batches of up to max_batch_chars characters, each
+    batch is checked with a single request, and every match is assigned back
+    to the text it falls in (offsets and contexts are rebased to that text). A
+    text longer than max_batch_chars is checked on its own. Matches that span
+    the separator between two texts are dropped.
+
+    Texts in a batch are separate paragraphs, not separate documents: rules
+    that look at the whole text (e.g. repeated words or inconsistent spelling
+    across paragraphs) can still see the neighbouring texts, so results may
+    differ slightly from calling analyze_grammar on each text.
+
+    Args:
+        texts: Romanian texts to analyze
+        filter_proper_nouns: If True, skip errors on capitalized words (likely names)
+        max_batch_chars: Upper bound on the joined length sent per request
+        max_errors: Keep details for at most this many errors per text
+
+    Returns:
+        One GrammarAnalysis per input text, in input order
+
+    Raises:
+        ImportError: If language-tool-python is not installed
+    """
+    tool = _get_tool()
+
+    results: list[Optional[GrammarAnalysis]] = [None] * len(texts)
+    word_counts = [len(text.split()) for text in texts]
+
+    batch: list[int] = []
+    batch_chars = 0
+    for i, text in enumerate(texts):
+        if word_counts[i] == 0:
+            results[i] = _empty_analysis()
+            continue
+        if batch and batch_chars + len(_BATCH_SEPARATOR) + len(text) > max_batch_chars:
+            _check_batch(tool, texts, batch, word_counts, results, filter_proper_nouns, max_errors)
+            batch = []
+            batch_chars = 0
+        if batch:
+            batch_chars += len(_BATCH_SEPARATOR)
+        batch.append(i)
+        batch_chars += len(text)
+    if batch:
+        _check_batch(tool, texts, batch, word_counts, results, filter_proper_nouns, max_errors)
+
+    return results
+
+
+def _check_batch(tool, texts, batch, word_counts, results, filter_proper_nouns, max_errors):
+    """Check the texts at the given indices with one request and fill results."""
+    starts = []
+    pos = 0
+    for i in batch:
+        starts.append(pos)
+        pos += len(texts[i]) + len(_BATCH_SEPARATOR)
+
+    per_text = [[] for _ in batch]
+    for m in tool.check(_BATCH_SEPARATOR.join(texts[i] for i in batch)):
+        k = bisect_right(starts, m.offset) - 1
+        if m.offset + m.error_length > starts[k] + len(texts[batch[k]]):
+            continue  # Spans the separator, belongs to no single text
+        per_text[k].append(m)
+
+    for k, i in enumerate(batch):
+        results[i] = _analysis_from_matches(
+            texts[i], word_counts[i], per_text[k], filter_proper_nouns, max_errors,
+            base=starts[k],
         )
 
-    # Get all matches
-    all_matches = tool.check(text)
+
+def _context_within(match, offset: int, text: str) -> str:
+    """
+    The match's context, clipped to the text the match belongs to.
+
+    LanguageTool shows the characters either side of an error, with "..."
+    where it cut the checked string. For a text checked in a batch that window
+    can run over the separator into the neighbouring texts; cutting it at the
+    text's edges, without "...", gives what checking the text alone gives.
+    offset is the match offset relative to text.
+    """
+    context = match.context
+    start = match.offset_in_context - offset  # Where text starts in context
+    # The character before the text is either part of a "..." prefix (the
+    # window starts inside the text) or the separator (it starts before)
+    if start > 0 and context[start - 1] != ".":
+        context = context[start:]
+        start = 0
+    end = start + len(text)  # Where text ends in context
+    if end < len(context) and context[end] != ".":
+        context = context[:end]
+    return context
+
+
+def _empty_analysis() -> GrammarAnalysis:
+    """Analysis for a text with no words."""
+    return GrammarAnalysis(
+        score=1.0,
+        total_words=0,
+        error_count=0,
+        raw_error_count=0,
+        weighted_errors=0,
+        error_density=0,
+        skipped_proper_nouns=0,
+        errors=[],
+    )
+
+
+def _analysis_from_matches(
+    text: str,
+    word_count: int,
+    all_matches: list,
+    filter_proper_nouns: bool,
+    max_errors: Optional[int] = None,
+    base: Optional[int] = None,
+) -> GrammarAnalysis:
+    """
+    Filter and weight LanguageTool matches for text into a GrammarAnalysis.
+
+    base is None when text was checked on its own, or the offset of text
+    within the batch request the matches came from; offsets and contexts in
+    the error details are then rebased to text. The matches are not modified.
+    """
     raw_count = len(all_matches)
 
     # Filter proper nouns if requested
@@ -133,7 +286,7 @@ def analyze_grammar(text: str, filter_proper_nouns: bool = True) -> GrammarAnaly
         matches = []
         skipped = 0
         for m in all_matches:
-            if is_proper_noun_error(m, text):
+            if is_proper_noun_error(m, text, base or 0):
                 skipped += 1
             else:
                 matches.append(m)
@@ -150,15 +303,23 @@ def analyze_grammar(text: str, filter_proper_nouns: bool = True) -> GrammarAnaly
         weight = SEVERITY_WEIGHTS.get(issue_type, 1)
         weighted_sum += weight
 
+        if max_errors is not None and len(errors) >= max_errors:
+            continue
+        if base is None:
+            offset = m.offset
+            context = m.context
+        else:
+            offset = m.offset - base
+            context = _context_within(m, offset, text)
         errors.append({
             "rule_id": m.rule_id,
             "issue_type": issue_type,
             "weight": weight,
             "message": m.message,
-            "context": m.context,
+            "context": context,
             "suggestions": m.replacements[:3] if m.replacements else [],
-            "offset": m.offset,
-            "length": m.errorLength,
+            "offset": offset,
+            "length": m.error_length,
         })
 
     # Compute score (0-1 scale)
@@ -166,7 +327,6 @@ def analyze_grammar(text: str, filter_proper_nouns: bool = True) -> GrammarAnaly
     # This means small error rates have minimal impact, but high rates are penalized heavily
     error_density = weighted_sum / word_count if word_count > 0 else 0
 
-    import math
     # Calibrated so that:
     # - 0% errors = 1.0
     # - 5% weighted error density = ~0.78
@@ -206,7 +366,7 @@ def compute_grammar_score(text: str) -> dict:
         }
 
     try:
-        analysis = analyze_grammar(text, filter_proper_nouns=True)
+        analysis = analyze_grammar(text, filter_proper_nouns=True, max_errors=10)
 
         return {
             "G_grammar": analysis.score,
@@ -216,7 +376,7 @@ def compute_grammar_score(text: str) -> dict:
             "weighted_errors": analysis.weighted_errors,
             "error_density": analysis.error_density,
             "skipped_proper_nouns": analysis.skipped_proper_nouns,
-            "errors": analysis.errors[:10],  # Limit to 10 examples
+            "errors": analysis.errors,  # Limited to 10 examples
         }
     except Exception as e:
         return {
@@ -226,6 +386,32 @@ def compute_grammar_score(text: str) -> dict:
         }
 
 
+def compute_grammar_scores(texts: list[str], workers: Optional[int] = None) -> list[dict]:
+    """
+    Compute G_grammar scores for many texts concurrently.
+
+    The time goes into waiting on the LanguageTool server, which handles
+    requests in parallel, so worker threads share one client; separate
+    processes would each start their own JVM.
+
+    Args:
+        texts: Romanian texts to analyze
+        workers: Number of worker threads (ThreadPoolExecutor default if None)
+
+    Returns:
+        One compute_grammar_score result per text, in input order
+    """
+    if is_available():
+        # Create the shared tool up front so threads do not race to start it
+        try:
+            _get_tool()
+        except Exception:
+            pass  # Every text reports the error through compute_grammar_score
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(compute_grammar_score, texts))
+
+
 def close_tool():
     """Close the LanguageTool instance to free resources."""
     global _tool_instance
@@ -10,7 +10,7 @@ is unambiguous and important for proper Romanian text.
 
 # Mapping: stripped_form -> set of correct diacritified forms
 # Some words have multiple valid forms (e.g., regional variants)
-DIACRITIC_WORDS: dict[str, set[str]] = {
+_DIACRITIC_FORMS: dict[str, set[str]] = {
     # ă words
     "aceasta": {"aceasta", "această"},
     "acestea": {"acestea"},
@@ -76,12 +76,9 @@ DIACRITIC_WORDS: dict[str, set[str]] = {
     "zapada": {"zăpadă"},
 
     # â words
-    "cand": {"când"},
     "cat": {"cât"},
     "cati": {"câți"},
     "cate": {"câte"},
-    "cateva": {"câteva"},
-    "cativa": {"câțiva"},
     "cantec": {"cântec"},
     "camp": {"câmp"},
     "campul": {"câmpul"},
@@ -101,7 +98,6 @@ DIACRITIC_WORDS: dict[str, set[str]] = {
     "pamant": {"pământ"},
     "parau": {"pârâu"},
     "ramas": {"rămas"},
-    "ramane": {"rămâne"},
     "rand": {"rând"},
     "randul": {"rândul"},
     "sangele": {"sângele"},
@@ -109,13 +105,11 @@ DIACRITIC_WORDS: dict[str, set[str]] = {
     "sant": {"sfânt"},
     "sfant": {"sfânt"},
     "zambi": {"zâmbi"},
-    "zambet": {"zâmbet"},
     "zambesc": {"zâmbesc"},
 
     # î words (initial/medial)
     "in": {"în"},
     "inainte": {"înainte"},
-    "inapoi": {"înapoi"},
     "inalt": {"înalt"},
     "inalta": {"înaltă"},
     "incepe": {"începe"},
@@ -127,31 +121,22 @@ DIACRITIC_WORDS: dict[str, set[str]] = {
     "inca": {"încă"},
     "incotro": {"încotro"},
     "indrazni": {"îndrăzni"},
-    "infrant": {"înfrânt"},
-    "insa": {"însă"},
     "insasi": {"însăși"},
     "insusi": {"însuși"},
     "intelege": {"înțelege"},
     "inteles": {"înțeles"},
     "intotdeauna": {"întotdeauna"},
-    "intr": {"într"},
     # NOTE: "intra" already defined above as {"intra", "intră"} - both present and imperfect
     "intreaba": {"întreabă"},
     "intrebare": {"întrebare"},
     "intreg": {"întreg"},
     "intreaga": {"întreagă", "întreaga"},  # Both indefinite and articulated forms valid
     "invata": {"învăța", "învață"},
-    "invatamant": {"învățământ"},
 
     # ș words
-    "asa": {"așa"},
-    "asadar": {"așadar"},
     "aseza": {"așeza"},
-    "castig": {"câștig"},
-    "castiga": {"câștiga", "câștigă"},
     "cunostinta": {"cunoștință"},
     "desigur": {"desigur"},
-    "scoala": {"școala", "școală"},
     "stia": {"știa"},
     "stie": {"știe"},
     "stii": {"știi"},
@@ -180,13 +165,10 @@ DIACRITIC_WORDS: dict[str, set[str]] = {
     "atatia": {"atâția"},
     "atatea": {"atâtea"},
     # NOTE: cativa, cateva, cati, cate already defined above
-    "cunostinta": {"cunoștință"},
     # NOTE: "dimineata" already defined above with both forms {"dimineața", "dimineață"}
     # NOTE: "fata" already defined above as {"fata", "fată"} - includes both meanings
     "functioneaza": {"funcționează"},
     "imediat": {"imediat"},
-    "intelege": {"înțelege"},
-    "inteles": {"înțeles"},
     # NOTE: "invatamant" already defined above
     "intelepciune": {"înțelepciune"},
     "natiune": {"națiune"},
@@ -208,12 +190,16 @@ DIACRITIC_WORDS: dict[str, set[str]] = {
 
     # Common function words (only unique entries)
     "acestia": {"aceștia"},
-    "acestea": {"acestea"},
     # NOTE: "aceasta" already defined above as {"aceasta", "această"}
     "acela": {"acela"},
     "aceea": {"aceea"},
 }
 
+# Read-only view of the mapping above: the form sets are only ever probed
+DIACRITIC_WORDS: dict[str, frozenset[str]] = {
+    stripped: frozenset(forms) for stripped, forms in _DIACRITIC_FORMS.items()
+}
+
 # Words that MUST have diacritics (unambiguous cases)
 # These are words where the ASCII form is NEVER valid Romanian.
 # IMPORTANT: Do NOT include words with multiple valid diacritified forms.
@@ -406,12 +392,9 @@ MUST_HAVE_DIACRITICS: dict[str, str] = {
     "intre": "între",           # between
     "inauntru": "înăuntru",     # inside
     "imprejur": "împrejur",     # around
-    "inapoi": "înapoi",         # back (already present but ensuring)
-    "inainte": "înainte",       # before/forward (already present)
 
     # Compound words
     "bineinteles": "bineînțeles",     # of course
-    "niciodata": "niciodată",         # never
     # NOTE: "totdeauna" and "oriunde" removed - they're valid without diacritics
 
     # Nouns with diacritics
@@ -513,7 +496,6 @@ MUST_HAVE_DIACRITICS: dict[str, str] = {
     "greseala": "greșeală",     # mistake
     "incercare": "încercare",   # attempt
     "intamplare": "întâmplare", # happening/event
-    "stiinta": "știință",       # science (already present but ensuring)
     "cunostinta": "cunoștință", # knowledge/acquaintance
     "fiinta": "ființă",         # being/creature
     "privinta": "privință",     # regard (în privința = regarding)
@@ -549,7 +531,7 @@ MUST_HAVE_DIACRITICS: dict[str, str] = {
 }
 
 # Common English words that indicate code-switching (should not appear in Romanian)
-ENGLISH_STOPWORDS: set[str] = {
+ENGLISH_STOPWORDS: frozenset[str] = frozenset({
     "the", "a", "an", "and", "or", "but", "if", "then", "else",
     "is", "are", "was", "were", "be", "been", "being",
     "have", "has", "had", "having",
@@ -571,17 +553,17 @@ ENGLISH_STOPWORDS: set[str] = {
     "however", "therefore", "furthermore", "moreover", "nevertheless",
     "for", "from", "of", "to", "by", "at", "on", "in",
     "as", "up", "out",
-}
+})
 
 # Words that look English but are valid Romanian or proper nouns (whitelist)
-ENGLISH_WHITELIST: set[str] = {
+ENGLISH_WHITELIST: frozenset[str] = frozenset({
     "ok", "weekend", "online", "email", "internet", "computer", "software",
     "marketing", "management", "design", "hotel", "restaurant", "taxi",
     "metro", "video", "audio", "tv", "radio", "film", "sport", "golf",
     "tennis", "fotbal", "fitness", "yoga", "pizza", "pasta", "menu",
     # Romanian words that look English
     "nu", "de", "pe", "care", "este", "sunt", "era", "avea",
-    "face", "vine", "merge", "place", "vine", "vor", "fi",
+    "face", "vine", "merge", "place", "vor", "fi",
     "din", "cu", "la", "prin", "spre", "sub", "asupra",
     "mare", "mic", "bun", "nou", "alt", "tot", "ori",
     "am", "ai", "are", "au",  # Romanian verb forms
@@ -590,4 +572,4 @@ ENGLISH_WHITELIST: set[str] = {
     "null", "true", "false",  # JSON literals
     # NOTE: "high", "medium", "low" removed - prompts now use Romanian
     # priority names (înaltă, medie, scăzută). If model outputs English, penalize.
-}
+})
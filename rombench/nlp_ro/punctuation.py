@@ -11,8 +11,11 @@ All checks are deterministic and language-agnostic but tuned for Romanian conven
 """
 
 import re
+from collections import Counter
 from dataclasses import dataclass
 
+from .caching import memoize_analysis
+
 
 @dataclass
 class PunctuationAnalysis:
@@ -28,12 +31,33 @@ class PunctuationAnalysis:
 
 
 # Punctuation that should NOT have space before it
-NO_SPACE_BEFORE = {'.', ',', ';', ':', '!', '?', ')', ']', '}', '"', '"', '»'}
+NO_SPACE_BEFORE: frozenset[str] = frozenset({'.', ',', ';', ':', '!', '?', ')', ']', '}', '"', '"', '»'})
 
 # Punctuation that should have space after it (if followed by text)
-SPACE_AFTER = {'.', ',', ';', ':', '!', '?'}
+SPACE_AFTER: frozenset[str] = frozenset({'.', ',', ';', ':', '!', '?'})
+
+# Pattern: word + space + punctuation
+_SPACE_BEFORE_PATTERN = re.compile(r'\w\s+([.,;:!?])')
+
+# Pattern: punctuation + letter (no space). Only flag if next char is uppercase
+_MISSING_AFTER_PATTERN = re.compile(r'([.,;:!?])([A-ZĂÂÎȘȚ])')
+
+_DOUBLE_SPACE_PATTERN = re.compile(r'  +')
+
+# Space after an opening / before a closing bracket or quote
+_SPACE_AFTER_OPEN_PATTERN = re.compile(r'[([\[{„«]\s+\w')
+_SPACE_BEFORE_CLOSE_PATTERN = re.compile(r'\w\s+[)\]}»]')
 
+# Words for repetition analysis
+_REPETITION_WORD_PATTERN = re.compile(r'\b\w+\b')
 
+# Lowercase letter starting a sentence
+_LOWERCASE_START_PATTERN = re.compile(r'[.!?]\s+([a-zăâîșț])')
+
+_NON_WORD_PATTERN = re.compile(r'[^\w]')
+
+
+@memoize_analysis("examples", "details")
 def analyze_punctuation(text: str) -> PunctuationAnalysis:
     """
     Analyze punctuation quality in text.
@@ -62,10 +86,13 @@ def analyze_punctuation(text: str) -> PunctuationAnalysis:
     double_spaces = 0
     other_issues = 0
 
+    # Each check is its own scan: the patterns overlap (e.g. "a .B" is both a
+    # space before '.' and a missing space after it), so a single alternation
+    # would consume text another check needs, and a lookahead-based fused scan
+    # benchmarked about 2x slower than these separate C-level passes.
+
     # Check for space before punctuation
-    # Pattern: word + space + punctuation
-    space_before_pattern = re.compile(r'\w\s+([.,;:!?])')
-    for match in space_before_pattern.finditer(text):
+    for match in _SPACE_BEFORE_PATTERN.finditer(text):
         space_before_punct += 1
         if len(issues) < 10:
             start = max(0, match.start() - 5)
@@ -76,8 +103,7 @@ def analyze_punctuation(text: str) -> PunctuationAnalysis:
     # Check for missing space after punctuation
     # Pattern: punctuation + letter (no space)
     # Exclude URLs, numbers (like 3.14), abbreviations
-    missing_after_pattern = re.compile(r'([.,;:!?])([A-ZĂÂÎȘȚ])')  # Only flag if next char is uppercase
-    for match in missing_after_pattern.finditer(text):
+    for match in _MISSING_AFTER_PATTERN.finditer(text):
         # Skip if it looks like a decimal number
         if match.group(1) == '.' and match.start() > 0:
             prev_char = text[match.start() - 1]
@@ -91,14 +117,13 @@ def analyze_punctuation(text: str) -> PunctuationAnalysis:
             issues.append(f"Missing space after '{match.group(1)}': ...{context}...")
 
     # Check for double/multiple spaces
-    double_space_pattern = re.compile(r'  +')
-    double_spaces = len(double_space_pattern.findall(text))
+    double_spaces = len(_DOUBLE_SPACE_PATTERN.findall(text))
     if double_spaces > 0 and len(issues) < 10:
         issues.append(f"Found {double_spaces} instances of multiple consecutive spaces")
 
     # Check for space after opening brackets/quotes (less severe)
     # Only check unambiguous opening: ( [ { „ «
-    space_after_open = len(re.findall(r'[([\[{„«]\s+\w', text))
+    space_after_open = len(_SPACE_AFTER_OPEN_PATTERN.findall(text))
     if space_after_open > 0:
         other_issues += space_after_open
 
@@ -106,11 +131,12 @@ def analyze_punctuation(text: str) -> PunctuationAnalysis:
     # Only check unambiguous closing: ) ] } " »
     # NOTE: ASCII " is ambiguous (opening or closing) - don't include it
     # Romanian closing quotes: " (right quote) or » (right guillemet)
-    space_before_close = len(re.findall(r'\w\s+[)\]}»]', text))
+    space_before_close = len(_SPACE_BEFORE_CLOSE_PATTERN.findall(text))
     if space_before_close > 0:
         other_issues += space_before_close
 
     total_issues = space_before_punct + missing_space_after + double_spaces + other_issues
+    text_length = len(text.split())
 
     # Calculate score
     # Each issue reduces score, but we cap the penalty
@@ -118,7 +144,6 @@ def analyze_punctuation(text: str) -> PunctuationAnalysis:
         score = 1.0
     else:
         # Penalize based on issue density
-        text_length = len(text.split())
         issue_rate = total_issues / max(text_length, 1)
         # Score decreases with more issues, but floor at 0.3
         score = max(0.3, 1.0 - (issue_rate * 5))
@@ -132,8 +157,8 @@ def analyze_punctuation(text: str) -> PunctuationAnalysis:
         other_issues=other_issues,
         examples=issues,
         details={
-            "text_length_words": len(text.split()),
-            "issue_rate": total_issues / max(len(text.split()), 1),
+            "text_length_words": text_length,
+            "issue_rate": total_issues / max(text_length, 1),
         }
     )
 
@@ -148,7 +173,7 @@ def analyze_repetition(text: str) -> dict:
         - type_token_ratio: vocabulary diversity
         - repeated_phrases: list of repeated 3+ word sequences
     """
-    words = re.findall(r'\b\w+\b', text.lower())
+    words = _REPETITION_WORD_PATTERN.findall(text.lower())
 
     if len(words) < 10:
         return {
@@ -162,16 +187,15 @@ def analyze_repetition(text: str) -> dict:
     unique_words = set(words)
     ttr = len(unique_words) / len(words)
 
-    # Find repeated phrases (3-grams that appear multiple times)
+    # Find repeated phrases (3-grams that appear multiple times). Tuple keys
+    # avoid building a joined string per position; only repeated phrases are
+    # formatted, in order of first occurrence.
     repeated_phrases = []
-    trigrams = {}
-    for i in range(len(words) - 2):
-        trigram = ' '.join(words[i:i+3])
-        trigrams[trigram] = trigrams.get(trigram, 0) + 1
+    trigrams = Counter(zip(words, words[1:], words[2:]))
 
-    for phrase, count in trigrams.items():
+    for trigram, count in trigrams.items():
         if count >= 3:  # Appears 3+ times
-            repeated_phrases.append(f"'{phrase}' (x{count})")
+            repeated_phrases.append(f"'{' '.join(trigram)}' (x{count})")
 
     # Score based on TTR and repeated phrases
     # TTR below 0.4 is low diversity
@@ -209,7 +233,7 @@ def analyze_capitalization(text: str) -> dict:
 
     # Check for sentences not starting with capital
     # Pattern: sentence-ending punctuation + space + lowercase
-    lowercase_starts = re.findall(r'[.!?]\s+([a-zăâîșț])', text)
+    lowercase_starts = _LOWERCASE_START_PATTERN.findall(text)
     for char in lowercase_starts:
         if len(issues) < 5:
             issues.append(f"Sentence starts with lowercase: '{char}...'")
@@ -218,8 +242,12 @@ def analyze_capitalization(text: str) -> dict:
     words = text.split()
     caps_words = []
     for word in words:
+        # Stripping punctuation never adds uppercase letters or length, so
+        # short and all-lowercase words (most of them) cannot qualify
+        if len(word) <= 3 or word.islower():
+            continue
         # Remove punctuation
-        clean = re.sub(r'[^\w]', '', word)
+        clean = _NON_WORD_PATTERN.sub('', word)
         if len(clean) > 3 and clean.isupper() and clean.isalpha():
             caps_words.append(word)
 
@@ -7,9 +7,10 @@ preserving diacritics and handling common punctuation.
 
 import re
 from dataclasses import dataclass
+from typing import Iterator
 
 
-@dataclass
+@dataclass(slots=True)
 class Token:
     """A single token with its metadata"""
     text: str           # Original text
@@ -34,6 +35,9 @@ TOKEN_PATTERN = re.compile(
     re.UNICODE
 )
 
+# Any Romanian diacritic, including the cedilla variants
+DIACRITIC_PATTERN = re.compile(r"[ăâîșțĂÂÎȘȚşţŞŢ]")
+
 
 def tokenize(text: str) -> list[Token]:
     """
@@ -69,7 +73,48 @@ def tokenize_words(text: str) -> list[str]:
     Returns:
         List of lowercase word strings
     """
-    return [tok.lower for tok in tokenize(text) if tok.is_word]
+    # Same words as the is_word tokens of tokenize(): the other token kinds
+    # never consume letters, so scanning for words alone finds the same spans
+    # without building Token objects for punctuation and numbers.
+    return [word.lower() for word in WORD_PATTERN.findall(text)]
+
+
+def tokenize_words_iter(text: str) -> Iterator[str]:
+    """
+    Lazily lowercase word tokens from text.
+
+    Same words as tokenize_words, but the lowercased copies are produced one
+    at a time instead of being collected into a second list. The raw matches
+    still come from a single findall(), which is much cheaper per token than
+    creating a match object for each word with finditer().
+
+    Args:
+        text: Input text string
+
+    Returns:
+        Iterator over lowercase word strings
+    """
+    return map(str.lower, WORD_PATTERN.findall(text))
+
+
+def tokenize_words_stripped(text: str) -> tuple[list[str], list[str]]:
+    """
+    Extract word tokens (lowercase) together with their diacritic-free forms.
+
+    The two lists are index-aligned: stripped[i] == strip_diacritics(words[i]).
+    Stripping runs once over the joined words instead of once per word.
+
+    Args:
+        text: Input text string
+
+    Returns:
+        (lowercase words, stripped words)
+    """
+    words = tokenize_words(text)
+    if not words:
+        return [], []
+    # Words never contain spaces and stripping maps characters one-to-one
+    return words, strip_diacritics(" ".join(words)).split(" ")
 
 
 def strip_diacritics(text: str) -> str:
@@ -82,6 +127,9 @@ def strip_diacritics(text: str) -> str:
     Returns:
         Text with diacritics replaced by ASCII equivalents
     """
+    # Most tokens are plain ASCII; isascii() is a flag check, no scan
+    if text.isascii():
+        return text
     replacements = {
         'ă': 'a', 'Ă': 'A',
         'â': 'a', 'Â': 'A',
@@ -111,6 +159,9 @@ def normalize_diacritics(text: str) -> str:
     Returns:
         Text with normalized diacritics
     """
+    # Cedilla variants are non-ASCII, so pure ASCII text has nothing to fix
+    if text.isascii():
+        return text
     replacements = {
         'ş': 'ș', 'Ş': 'Ș',
         'ţ': 'ț', 'Ţ': 'Ț',
@@ -131,8 +182,8 @@ def has_romanian_diacritics(text: str) -> bool:
     Returns:
         True if any Romanian diacritics are present
     """
-    diacritics = set('ăâîșțĂÂÎȘȚşţŞŢ')
-    return any(c in diacritics for c in text)
+    # search() stops at the first hit; ASCII text cannot contain any
+    return not text.isascii() and DIACRITIC_PATTERN.search(text) is not None
 
 
 def count_diacritics(text: str) -> dict[str, int]:
@@ -242,7 +242,7 @@ class RomanianNLPToolkit:
         punctuation_score = punctuation_analysis.score
 
         # Check if text is predominantly English
-        is_english = is_likely_english_text(normalized)
+        is_english = is_likely_english_text(normalized, analysis=codeswitch_analysis)
         if is_english:
             # Severe penalty for responding in wrong language
             codeswitch_score = 0.1
@@ -27,7 +27,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from rombench.gmtw_ro.worlds.base import (
     Instance, World, Constraint, Goal, Entity, ConstraintType, GoalType
 )
-from rombench.gmtw_ro.worlds.travel import CITIES
+from rombench.gmtw_ro.worlds.travel import CITIES, build_attraction_entities
 from rombench.gmtw_ro.worlds.schedule import DAYS_RO, DAYS_EN, SLOTS_RO, SLOTS_EN, MEETING_TYPES
 from rombench.gmtw_ro.worlds.fact import FACTS
 from rombench.gmtw_ro.worlds.recipe import DISHES
@@ -269,36 +269,7 @@ class ExtremeTravelGenerator:
         selected_attractions = all_attractions[:]
 
         # Create entities
-        entities = {}
-        attractions_list = []
-
-        for idx, attr in enumerate(selected_attractions):
-            attr_id = f"A{idx + 1}"
-            name_en = attr.get("name_en", attr["name"])
-            aliases = [
-                attr["name"].lower(),
-                attr["name"].lower().replace("ă", "a").replace("â", "a").replace("î", "i").replace("ș", "s").replace("ț", "t"),
-                name_en,
-                name_en.lower(),
-            ]
-            entities[attr_id] = Entity(
-                id=attr_id,
-                name=attr["name"],
-                aliases=aliases,
-                attributes=attr,
-            )
-
-            attractions_list.append({
-                "id": attr_id,
-                "name": attr["name"],
-                "name_en": attr.get("name_en", attr["name"]),
-                "type": attr["type"],
-                "type_en": attr.get("type_en", attr["type"]),
-                "indoor": attr["indoor"],
-                "family_friendly": attr["family_friendly"],
-                "duration_hours": attr["duration_hours"],
-                "cost_lei": attr.get("cost_lei", 0),
-            })
+        entities, attractions_list = build_attraction_entities(selected_attractions)
 
         # Calculate stats for constraint tuning
         total_cost = sum(a.get("cost_lei", 0) for a in selected_attractions)
@@ -313,8 +284,9 @@ class ExtremeTravelGenerator:
         constraints = []
 
         # 1. Must include a type (monument OR museum, not both)
-        has_monument = any(a["type"] == "monument" for a in selected_attractions)
-        has_museum = any(a["type"] == "muzeu" for a in selected_attractions)
+        available_types = {a["type"] for a in selected_attractions}
+        has_monument = "monument" in available_types
+        has_museum = "muzeu" in available_types
 
         if has_monument and has_museum:
             # Pick one, not both
@@ -408,7 +380,6 @@ class ExtremeTravelGenerator:
                 )
 
         # 5. Type diversity (only if we have enough types) - ALWAYS add this now
-        available_types = set(a["type"] for a in selected_attractions)
         if len(available_types) >= 3:
             constraints.append(
                 Constraint(
@@ -8,11 +8,20 @@ Tests cover:
 - Overall text quality scoring
 """
 
+import ast
+import copy
+import inspect
+import re
+import threading
+
 import pytest
+from rombench.nlp_ro import codeswitch, grammar, lexicon, punctuation
 from rombench.nlp_ro import (
     # Tokenizer
     tokenize,
     tokenize_words,
+    tokenize_words_iter,
+    tokenize_words_stripped,
     strip_diacritics,
     normalize_diacritics,
     has_romanian_diacritics,
@@ -53,6 +62,18 @@ class TestTokenizer:
         assert "română" in words
         assert "." not in words
 
+    def test_tokenize_words_iter(self):
+        """Test lazy word tokenization matches tokenize_words"""
+        text = "Aceasta este o propoziție, în 2024, despre Cluj-Napoca."
+        assert list(tokenize_words_iter(text)) == tokenize_words(text)
+
+    def test_tokenize_words_stripped(self):
+        """Test words and stripped forms stay index-aligned"""
+        words, stripped = tokenize_words_stripped("Țara și-a ales, în 2024, președintele.")
+        assert words == ["țara", "și-a", "ales", "în", "președintele"]
+        assert stripped == ["tara", "si-a", "ales", "in", "presedintele"]
+        assert tokenize_words_stripped("... 123") == ([], [])
+
     def test_strip_diacritics(self):
         """Test diacritic stripping"""
         assert strip_diacritics("ăâîșț") == "aaist"
@@ -70,6 +91,8 @@ class TestTokenizer:
         assert has_romanian_diacritics("română") is True
         assert has_romanian_diacritics("Romania") is False
         assert has_romanian_diacritics("și") is True
+        assert has_romanian_diacritics("Şcoala") is True  # cedilla variant
+        assert has_romanian_diacritics("café — naïve") is False
 
 
 class TestDiacriticAnalyzer:
@@ -148,6 +171,214 @@ class TestCodeSwitchDetector:
         assert "de" not in result.flagged_words
         assert "pe" not in result.flagged_words
 
+    def test_word_lists_have_no_duplicate_entries(self):
+        """Test the set and dict literals behind the word lists list each word once"""
+        for module in (codeswitch, lexicon):
+            tree = ast.parse(inspect.getsource(module))
+            for node in ast.walk(tree):
+                if isinstance(node, ast.Set):
+                    elts = node.elts
+                elif isinstance(node, ast.Dict):
+                    elts = node.keys
+                else:
+                    continue
+                words = [elt.value for elt in elts if isinstance(elt, ast.Constant)]
+                dupes = {w for w in words if words.count(w) > 1}
+                assert not dupes, f"{module.__name__}:{node.lineno} repeats {sorted(dupes)}"
+
+
+class TestPunctuationAnalyzer:
+    """Tests for punctuation analysis"""
+
+    def test_repeated_phrases(self):
+        """Test trigrams seen 3+ times are reported in order of first occurrence"""
+        text = "ana are mere " * 3 + "si pere si prune."
+        result = punctuation.analyze_repetition(text)
+        assert result["repeated_phrases"] == ["'ana are mere' (x3)"]
+        assert result["total_words"] == 13
+
+    def test_capitalization(self):
+        """Test lowercase sentence starts and ALL CAPS words are flagged"""
+        result = punctuation.analyze_capitalization("Salut. ce faci? Am zis STOP, ONU e ok.")
+        assert result["lowercase_sentence_starts"] == 1
+        assert result["all_caps_words"] == 1  # "ONU" is too short to count
+        assert "STOP," in result["issues"][-1]
+
+
+class _StubMatch:
+    """
+    A language-tool-python 3.x Match, limited to the fields the grammar module
+    reads; like the real one, any other attribute (e.g. the 2.x camelCase
+    names) raises AttributeError
+    """
+
+    __slots__ = (
+        "rule_id", "rule_issue_type", "message", "replacements",
+        "offset", "error_length", "context", "offset_in_context",
+    )
+
+    def __init__(self, checked, offset, length, rule_id):
+        self.rule_id = rule_id
+        self.rule_issue_type = "misspelling"
+        self.message = "Possible spelling mistake"
+        self.replacements = ["greșit"]
+        self.offset = offset
+        self.error_length = length
+        # Built like LanguageTool's: 40 characters either side, "..." where
+        # the checked string was cut, newlines shown as spaces
+        flat = checked.replace("\n", " ")
+        start, end = offset - 40, offset + length + 40
+        prefix = "..." if start >= 0 else ""
+        postfix = "..." if end <= len(flat) else ""
+        start, end = max(start, 0), min(end, len(flat))
+        self.context = prefix + flat[start:end] + postfix
+        self.offset_in_context = offset - start + len(prefix)
+
+
+class _StubTool:
+    """Flags every "gresit", and "z" pairs that may span a batch separator"""
+
+    def __init__(self):
+        self.requests = []
+        self.matches = []
+
+    def check(self, text):
+        self.requests.append(text)
+        found = [
+            _StubMatch(text, m.start(), m.end() - m.start(), "MORFOLOGIK_RULE_RO_RO")
+            for m in re.finditer(r"[Gg]resit", text)
+        ] + [
+            _StubMatch(text, m.start(), m.end() - m.start(), "Z_PAIR")
+            for m in re.finditer(r"z\s+z", text)
+        ]
+        self.matches.extend((text, m) for m in found)
+        return found
+
+
+@pytest.fixture
+def stub_tool(monkeypatch):
+    """A stub LanguageTool in place of the real one, with an empty result cache"""
+    tool = _StubTool()
+    monkeypatch.setattr(grammar, "_tool_instance", tool)
+    grammar.analyze_grammar.cache_clear()
+    yield tool
+    grammar.analyze_grammar.cache_clear()
+
+
+class TestGrammarBatch:
+    """Tests for batched grammar analysis"""
+
+    TEXTS = [
+        "un text gresit aici",
+        "",
+        "Gresit la inceput si gresit",
+        "   ",
+        "fara erori z",
+        "z alt text gresit\ncu un rand nou",
+        "x " * 40 + "gresit " + "y " * 40,
+        "gresit " * 20,
+        "ultimul text gresit",
+    ]
+
+    def test_batch_matches_single_text_results(self, stub_tool):
+        """Test batched results equal per-text ones, contexts and offsets included"""
+        single = [grammar.analyze_grammar(text) for text in self.TEXTS]
+        single_requests = len(stub_tool.requests)
+        stub_tool.requests.clear()
+
+        batched = grammar.analyze_grammar_batch(self.TEXTS, max_batch_chars=100)
+
+        assert batched == single
+        assert len(stub_tool.requests) < single_requests
+        # Longer than max_batch_chars: sent on its own
+        assert "gresit " * 20 in stub_tool.requests
+        assert batched[1].total_words == 0 and batched[3].total_words == 0
+
+    def test_batch_leaves_matches_unmodified(self, stub_tool):
+        """Test the tool's matches keep their offsets into the checked string"""
+        grammar.analyze_grammar_batch(self.TEXTS, max_batch_chars=100)
+        assert stub_tool.matches
+        for checked, m in stub_tool.matches:
+            assert re.fullmatch(r"[Gg]resit|z\s+z", checked[m.offset:m.offset + m.error_length])
+
+
+class TestGrammarScores:
+    """Tests for concurrent grammar scoring"""
+
+    TEXTS = ["un text gresit", "fara erori", "gresit gresit gresit", "", "alt text gresit aici"]
+
+    def test_results_in_input_order(self, stub_tool, monkeypatch):
+        """Test each result belongs to the text at the same position"""
+        monkeypatch.setattr(grammar, "is_available", lambda: True)
+        results = grammar.compute_grammar_scores(self.TEXTS, workers=4)
+        assert [r["error_count"] for r in results] == [1, 0, 3, 0, 1]
+        assert results == [grammar.compute_grammar_score(text) for text in self.TEXTS]
+
+    def test_unavailable(self, monkeypatch):
+        """Test every text reports LanguageTool missing, without starting a tool"""
+        def fail():
+            raise AssertionError("tool must not be created")
+
+        monkeypatch.setattr(grammar, "is_available", lambda: False)
+        monkeypatch.setattr(grammar, "_get_tool", fail)
+        results = grammar.compute_grammar_scores(self.TEXTS)
+        assert len(results) == len(self.TEXTS)
+        assert all(r["available"] is False and r["G_grammar"] is None for r in results)
+        assert all("not installed" in r["error"] for r in results)
+
+    def test_tool_created_before_workers(self, monkeypatch):
+        """Test the shared tool is started once, on the calling thread"""
+        tool = _StubTool()
+        callers = []
+
+        def get_tool():
+            callers.append(threading.current_thread())
+            return tool
+
+        monkeypatch.setattr(grammar, "is_available", lambda: True)
+        monkeypatch.setattr(grammar, "_get_tool", get_tool)
+        grammar.analyze_grammar.cache_clear()
+        results = grammar.compute_grammar_scores(self.TEXTS, workers=4)
+        grammar.analyze_grammar.cache_clear()
+        assert callers[0] is threading.current_thread()
+        assert all(r["available"] for r in results)
+
+    def test_tool_start_failure_reported_per_text(self, monkeypatch):
+        """Test a tool that fails to start is reported by every text"""
+        def get_tool():
+            raise RuntimeError("server unreachable")
+
+        monkeypatch.setattr(grammar, "is_available", lambda: True)
+        monkeypatch.setattr(grammar, "_get_tool", get_tool)
+        grammar.analyze_grammar.cache_clear()
+        results = grammar.compute_grammar_scores(self.TEXTS, workers=2)
+        assert results == [
+            {"G_grammar": None, "available": False, "error": "server unreachable"}
+        ] * len(self.TEXTS)
+
+
+class TestAnalysisCaching:
+    """Tests for memoized analyzer results"""
+
+    @pytest.mark.parametrize("analyze, text, field", [
+        (analyze_diacritics, "Eu merg in oras si cumpar paine.", "missing_words"),
+        (detect_code_switching, "Aceasta este the best propoziție and very good.", "flagged_words"),
+        (punctuation.analyze_punctuation, "Eu merg acasa .Apoi plec  din nou .", "examples"),
+        (grammar.analyze_grammar, "un text gresit si alt cuvant gresit", "errors"),
+    ])
+    def test_repeat_calls_return_independent_results(self, stub_tool, analyze, text, field):
+        """Test mutating a result does not leak into later calls on the same text"""
+        first = analyze(text)
+        expected = copy.deepcopy(first)
+        items = getattr(first, field)
+        assert items
+        if isinstance(items[0], dict):
+            items[0]["suggestions"].clear()
+        items.clear()
+        if hasattr(first, "details"):
+            first.details.clear()
+        assert analyze(text) == expected
+
 
 class TestRomanianNLPToolkit:
     """Tests for the main toolkit"""